@@ -1,3 +1,3 @@
-from .account import get_spending, set_budget
+from .account import get_spending, get_budget_report, evaluate_budgets, set_budget
 from .process import LabellingAssistant
 from .storage import FileManager
\ No newline at end of file
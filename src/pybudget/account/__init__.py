@@ -1,2 +1,3 @@
-from .report import get_spending
-from .manage import set_budget
\ No newline at end of file
+from .report import get_spending, get_budget_report
+from .manage import set_budget
+from .budget import evaluate_budgets, get_categorized_spending, load_budget_allocations
@@ -0,0 +1,127 @@
+from numbers import Number
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_PERIOD = 'default'
+
+ALLOCATION_COLUMNS = ['budget', 'period', 'category', 'allocated']
+EVALUATION_COLUMNS = [
+    'budget',
+    'month',
+    'category',
+    'allocated',
+    'spent',
+    'percent_used',
+    'monthly_average',
+    'difference_from_average',
+    'percent_from_average'
+]
+
+
+def is_allocation(mapping: Dict[str, Any]) -> bool:
+    return not any(isinstance(value, dict) for value in mapping.values())
+
+
+def _parse_period(name: str, period: Any) -> pd.Period:
+    if period == DEFAULT_PERIOD:
+        return pd.NaT
+
+    try:
+        return pd.Period(str(period), freq='M')
+    except ValueError:
+        raise ValueError(f'Budget {name} has period {period!r}, expected {DEFAULT_PERIOD} or YYYY-MM')
+
+
+def _validate_allocation(name: str, allocation: Any) -> None:
+    if not isinstance(allocation, dict) or not is_allocation(allocation):
+        raise ValueError(f'Budget {name} must map categories to amounts')
+
+    for category, amount in allocation.items():
+        if isinstance(amount, bool) or not isinstance(amount, Number):
+            raise ValueError(f'Budget {name} amount for {category} must be a number, got {amount!r}')
+
+
+# main.yaml is either the original flat category: amount mapping, which becomes
+# a single budget named 'main', or a mapping of budget names to allocations. A
+# budget's allocations are either category: amount, applied to every month, or
+# keyed by period ('default' or YYYY-MM) with category: amount under each.
+def load_budget_allocations(budget: Dict[str, Any]) -> pd.DataFrame:
+    if not isinstance(budget, dict):
+        raise ValueError('Budget file must map categories or budget names to allocations')
+
+    if is_allocation(budget):
+        budget = { 'main': budget }
+
+    rows = list()
+
+    for name, periods in budget.items():
+        if not isinstance(periods, dict):
+            raise ValueError(f'Budget {name} must map categories or periods to amounts')
+
+        if is_allocation(periods):
+            periods = { DEFAULT_PERIOD: periods }
+
+        for period, allocations in periods.items():
+            _validate_allocation(name, allocations)
+            period = _parse_period(name, period)
+            for category, amount in allocations.items():
+                rows.append((name, period, category, float(amount)))
+
+    return pd.DataFrame(rows, columns=ALLOCATION_COLUMNS).astype({'period': 'period[M]', 'allocated': float})
+
+
+def get_categorized_spending(transactions: pd.DataFrame) -> pd.DataFrame:
+    labeled = transactions.loc[transactions['category'] != 'TO_LABEL', ['date', 'amount', 'category']]
+
+    split = labeled.assign(
+        amount=labeled['amount'].astype(str).str.split(','),
+        category=labeled['category'].str.split(',')
+    ).explode(['amount', 'category'])
+
+    split['amount'] = split['amount'].astype(float)
+    split['month'] = pd.to_datetime(split['date']).dt.to_period('M')
+
+    spending = split.groupby(['month', 'category'], as_index=False)['amount'].sum()
+    return spending.rename(columns={'amount': 'spent'})
+
+
+# Period specific allocations override the default allocation of the same
+# category for that month, other default categories still apply.
+def evaluate_budgets(budget: Dict[str, Any], transactions: pd.DataFrame) -> pd.DataFrame:
+    allocations = load_budget_allocations(budget)
+    spending = get_categorized_spending(transactions)
+
+    if spending.empty or allocations.empty:
+        return pd.DataFrame(columns=EVALUATION_COLUMNS)
+
+    months = pd.period_range(spending['month'].min(), spending['month'].max(), freq='M')
+
+    defaults = allocations.loc[allocations['period'].isna()].drop(columns='period')
+    default_grid = defaults.merge(pd.DataFrame({'month': months}), how='cross')
+
+    specific = allocations.loc[allocations['period'].notna()].rename(columns={'period': 'month'})
+    specific = specific.loc[specific['month'].isin(months)]
+
+    grid = pd.concat((specific, default_grid), ignore_index=True).drop_duplicates(
+        ['budget', 'month', 'category'],
+        keep='first'
+    )
+
+    evaluation = grid.merge(spending, on=['month', 'category'], how='left')
+    evaluation['spent'] = evaluation['spent'].fillna(0.0)
+
+    # months without spending in a category count towards its average as zero
+    monthly_average = spending.groupby('category')['spent'].sum() / len(months)
+    evaluation['monthly_average'] = evaluation['category'].map(monthly_average).fillna(0.0)
+
+    allocated = evaluation['allocated'].replace(0.0, np.nan)
+    average = evaluation['monthly_average'].replace(0.0, np.nan)
+
+    evaluation['percent_used'] = evaluation['spent'] / allocated * 100
+    evaluation['difference_from_average'] = evaluation['spent'] - evaluation['monthly_average']
+    evaluation['percent_from_average'] = evaluation['difference_from_average'] / average * 100
+
+    return evaluation.sort_values(['budget', 'month', 'category'], ignore_index=True)[EVALUATION_COLUMNS]
@@ -1,7 +1,29 @@
-from typing import Dict
+from typing import Any, Dict
 
+from .budget import is_allocation, load_budget_allocations
 
-def set_budget(budget: Dict[str, int]) -> Dict[str, int]:
+
+def set_budget(budget: Dict[str, Any]) -> Dict[str, Any]:
+    # fail on a malformed budget file before asking for anything
+    load_budget_allocations(budget)
+
+    if is_allocation(budget):
+        return set_allocation(budget)
+
+    for name, periods in budget.items():
+        if is_allocation(periods):
+            print(f'Budget {name}:')
+            budget[name] = set_allocation(periods)
+            continue
+
+        for period, allocation in periods.items():
+            print(f'Budget {name} ({period}):')
+            periods[period] = set_allocation(allocation)
+
+    return budget
+
+
+def set_allocation(budget: Dict[str, int]) -> Dict[str, int]:
     for category, budget_amount in budget.items():
         new_amount = input(f'What amount for {category} (current: {budget_amount})? ')
         budget[category] = int(new_amount) if new_amount else budget_amount
@@ -24,4 +46,3 @@ def set_budget(budget: Dict[str, int]) -> Dict[str, int]:
 
     print()
     return budget
-
@@ -1,8 +1,11 @@
 from collections import defaultdict
 from datetime import datetime
+from typing import Any, Dict
 
 import pandas as pd
 
+from .budget import evaluate_budgets
+
 def get_spending(transactions: pd.DataFrame):
 
     category_to_spending = defaultdict(float)
@@ -32,4 +35,23 @@ def get_spending(transactions: pd.DataFrame):
 
 
 def get_percentage_of_spending(transactions: pd.DataFrame) -> None: 
-    print('you did it')
\ No newline at end of file
+    print('you did it')
+
+
+def get_budget_report(budget: Dict[str, Any], transactions: pd.DataFrame) -> None:
+    evaluation = evaluate_budgets(budget, transactions)
+
+    for (name, month), month_evaluation in evaluation.groupby(['budget', 'month']):
+        print(f'Budget {name} for {month}')
+        for row in month_evaluation.itertuples():
+            used = f'{row.percent_used:.0f}%' if row.allocated else 'nothing allocated'
+
+            difference = round(row.difference_from_average, 2)
+            if not difference:
+                comparison = 'at Monthly Average'
+            else:
+                direction = 'above' if difference > 0 else 'below'
+                percent = f' ({abs(row.percent_from_average):.0f}%)' if row.monthly_average else ''
+                comparison = f'${abs(difference):.2f}{percent} {direction} Monthly Average'
+
+            print(f'\t{row.category}: ${row.spent:.2f} of ${row.allocated:.2f} used ({used}) ==> {comparison}')
\ No newline at end of file
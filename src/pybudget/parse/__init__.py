@@ -1 +1,3 @@
-from .parse import parse_transaction
\ No newline at end of file
+from .parse import parse_transaction, parse_transactions
+from .institution import InstitutionParser, CreditFlagParser, DebitCreditParser
+from .registry import register_institution, get_institution_parser, institution_parsers
@@ -0,0 +1,143 @@
+from collections import namedtuple
+from datetime import datetime
+from typing import List, Sequence
+
+import pandas as pd
+
+
+Transaction = namedtuple('Transaction', 'date description amount institution')
+
+
+# Columns are positional indices into each csv row. sign normalizes amounts so
+# that expenses are positive, matching the ledger.
+class InstitutionParser:
+
+    date_format = '%m/%d/%Y'
+
+    def __init__(
+        self,
+        name: str,
+        filename_pattern: str,
+        date_column: int,
+        description_column: int,
+        amount_column: int,
+        sign: int = 1
+    ) -> None:
+        self.name = name
+        self.filename_pattern = filename_pattern
+        self.date_column = date_column
+        self.description_column = description_column
+        self.amount_column = amount_column
+        self.sign = sign
+
+    def parse_row(self, row: Sequence[str]) -> Transaction:
+        self._check_width([row])
+
+        date = datetime.strptime(row[self.date_column], self.date_format)
+        description = row[self.description_column]
+
+        return Transaction(date, description, self._row_amount(row), self.name)
+
+    def parse_rows(self, rows: List[Sequence[str]]) -> List[Transaction]:
+        if not rows:
+            return list()
+
+        self._check_width(rows)
+
+        frame = pd.DataFrame(rows).fillna('')
+        dates = pd.to_datetime(frame[self.date_column], format=self.date_format)
+
+        # strptime rejects blank dates, to_datetime turns them into NaT
+        if dates.isna().any():
+            raise ValueError(f'{self.name} rows have blank dates')
+
+        dates = dates.dt.to_pydatetime()
+        descriptions = frame[self.description_column].tolist()
+        amounts = self._column_amounts(frame).tolist()
+
+        return [
+            Transaction(date, description, amount, self.name)
+            for date, description, amount in zip(dates, descriptions, amounts)
+        ]
+
+    def _columns(self) -> List[int]:
+        return [self.date_column, self.description_column, self.amount_column]
+
+    def _check_width(self, rows: List[Sequence[str]]) -> None:
+        width = max(self._columns()) + 1
+        for row in rows:
+            if len(row) < width:
+                raise ValueError(f'{self.name} rows need at least {width} columns, got {len(row)}')
+
+    def _row_amount(self, row: Sequence[str]) -> float:
+        return self.sign * float(row[self.amount_column])
+
+    # astype(float) raises on blank amounts like float() does, to_numeric
+    # would silently turn them into NaN
+    def _column_amounts(self, frame: pd.DataFrame) -> pd.Series:
+        return self.sign * frame[self.amount_column].astype(float)
+
+
+# Single amount column plus a column flagging the row as a credit or debit
+class CreditFlagParser(InstitutionParser):
+
+    def __init__(
+        self,
+        name: str,
+        filename_pattern: str,
+        date_column: int,
+        description_column: int,
+        amount_column: int,
+        flag_column: int,
+        credit_flag: str = 'Credit',
+        sign: int = 1
+    ) -> None:
+        super().__init__(name, filename_pattern, date_column, description_column, amount_column, sign)
+        self.flag_column = flag_column
+        self.credit_flag = credit_flag
+
+    def _columns(self) -> List[int]:
+        return super()._columns() + [self.flag_column]
+
+    def _row_amount(self, row: Sequence[str]) -> float:
+        amount = super()._row_amount(row)
+        return -amount if row[self.flag_column] == self.credit_flag else amount
+
+    def _column_amounts(self, frame: pd.DataFrame) -> pd.Series:
+        amounts = super()._column_amounts(frame)
+        return amounts.where(frame[self.flag_column] != self.credit_flag, -amounts)
+
+
+# Debits and credits in separate columns. Debits are exported with a leading
+# sign character which is dropped, credits are negated.
+class DebitCreditParser(InstitutionParser):
+
+    def __init__(
+        self,
+        name: str,
+        filename_pattern: str,
+        date_column: int,
+        description_column: int,
+        debit_column: int,
+        credit_column: int
+    ) -> None:
+        super().__init__(name, filename_pattern, date_column, description_column, debit_column)
+        self.debit_column = debit_column
+        self.credit_column = credit_column
+
+    def _columns(self) -> List[int]:
+        return super()._columns() + [self.credit_column]
+
+    def _row_amount(self, row: Sequence[str]) -> float:
+        credit = row[self.credit_column]
+        return -float(credit) if credit else float(row[self.debit_column][1:])
+
+    def _column_amounts(self, frame: pd.DataFrame) -> pd.Series:
+        credits = frame[self.credit_column]
+        has_credit = credits != ''
+
+        amounts = pd.Series(0.0, index=frame.index)
+        amounts[has_credit] = -credits[has_credit].astype(float)
+        amounts[~has_credit] = frame.loc[~has_credit, self.debit_column].str[1:].astype(float)
+
+        return amounts
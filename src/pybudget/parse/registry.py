@@ -0,0 +1,28 @@
+from typing import Dict
+
+from .institution import (
+    InstitutionParser,
+    CreditFlagParser,
+    DebitCreditParser
+)
+
+
+institution_parsers: Dict[str, InstitutionParser] = dict()
+
+
+def register_institution(parser: InstitutionParser) -> InstitutionParser:
+    institution_parsers[parser.name] = parser
+    return parser
+
+
+def get_institution_parser(institution: str) -> InstitutionParser:
+    if institution not in institution_parsers:
+        raise NotImplementedError(f'{institution} not implemented')
+
+    return institution_parsers[institution]
+
+
+register_institution(InstitutionParser('amex', 'amex*', 0, 1, 2))
+register_institution(InstitutionParser('chase', 'chase*', 0, 2, 5, sign=-1))
+register_institution(CreditFlagParser('navyfed', 'navyfed*', 0, 9, 1, flag_column=2))
+register_institution(DebitCreditParser('becu', 'becu*', 0, 2, debit_column=3, credit_column=4))
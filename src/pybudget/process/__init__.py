@@ -1,2 +1,3 @@
 from .transaction import convert_transactions_to_usable_data
-from .label import LabellingAssistant
\ No newline at end of file
+from .label import LabellingAssistant
+from .featurize import HashedTfidfVectorizer
\ No newline at end of file
@@ -0,0 +1,90 @@
+from typing import Iterable, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+
+# Drop-in replacement for TfidfVectorizer that hashes n-grams into a fixed
+# number of columns instead of keeping a vocabulary. Only document frequencies
+# are stored, so idf statistics can be updated one labeled transaction at a time
+# and statistics gathered by separate workers can be merged.
+#
+# partial_fit only collects pending statistics. transform keeps using the idf
+# the models were trained with until apply_partial_fit is called.
+class HashedTfidfVectorizer:
+
+    def __init__(self, analyzer: str = 'char', ngram_range: Tuple[int, int] = (1, 2), n_features: int = 2 ** 12) -> None:
+        self.hasher = HashingVectorizer(
+            analyzer=analyzer,
+            ngram_range=ngram_range,
+            n_features=n_features,
+            alternate_sign=False,
+            norm=None
+        )
+        self.n_features = n_features
+        self.document_frequencies = np.zeros(n_features, dtype=np.int32)
+        self.num_documents = 0
+        self.pending_document_frequencies = np.zeros(n_features, dtype=np.int32)
+        self.pending_num_documents = 0
+
+    def fit(self, raw_documents: Iterable[str]) -> 'HashedTfidfVectorizer':
+        self.pending_document_frequencies[:] = 0
+        self.pending_num_documents = 0
+
+        counts = self._count(raw_documents)
+        self.document_frequencies[:] = self._document_frequencies(counts)
+        self.num_documents = counts.shape[0]
+
+        return self
+
+    def partial_fit(self, raw_documents: Iterable[str]) -> 'HashedTfidfVectorizer':
+        counts = self._count(raw_documents)
+
+        self.pending_document_frequencies += self._document_frequencies(counts)
+        self.pending_num_documents += counts.shape[0]
+
+        return self
+
+    def apply_partial_fit(self) -> 'HashedTfidfVectorizer':
+        self.document_frequencies += self.pending_document_frequencies
+        self.num_documents += self.pending_num_documents
+
+        self.pending_document_frequencies[:] = 0
+        self.pending_num_documents = 0
+
+        return self
+
+    def merge(self, other: 'HashedTfidfVectorizer') -> 'HashedTfidfVectorizer':
+        if self.n_features != other.n_features:
+            raise ValueError(f'Cannot merge {other.n_features} hashed features into {self.n_features}')
+
+        self.document_frequencies += other.document_frequencies
+        self.num_documents += other.num_documents
+        self.pending_document_frequencies += other.pending_document_frequencies
+        self.pending_num_documents += other.pending_num_documents
+
+        return self
+
+    def transform(self, raw_documents: Iterable[str]) -> csr_matrix:
+        X = self._count(raw_documents).astype(np.float64)
+
+        # smoothed idf, matching TfidfVectorizer's default
+        document_frequencies = self.document_frequencies[X.indices]
+        X.data *= np.log((1 + self.num_documents) / (1 + document_frequencies)) + 1
+
+        return normalize(X)
+
+    def fit_transform(self, raw_documents: Iterable[str]) -> csr_matrix:
+        raw_documents = list(raw_documents)
+        return self.fit(raw_documents).transform(raw_documents)
+
+    def _document_frequencies(self, counts: csr_matrix) -> np.ndarray:
+        return np.bincount(counts.indices, minlength=self.n_features).astype(np.int32)
+
+    def _count(self, raw_documents: Iterable[str]) -> csr_matrix:
+        counts = self.hasher.transform(raw_documents)
+        counts.sum_duplicates()
+
+        return counts
@@ -12,6 +12,8 @@ from sklearn.model_selection import train_test_split
 from sklearn.neural_network import MLPRegressor, MLPClassifier
 from sklearn.svm import LinearSVC
 
+from .featurize import HashedTfidfVectorizer
+
 
 PreparedTransaction = namedtuple('PreparedTransaction', 'transaction_string categories amounts total_amount')
 
@@ -24,7 +26,8 @@ class LabellingAssistant:
     }
 
     vectorizer_name_to_class = {
-        'tfidf': TfidfVectorizer
+        'tfidf': TfidfVectorizer,
+        'hashed': HashedTfidfVectorizer
     }
 
     def __init__(self, category_model='mlpc', amount_model='mlpr', vectorizer = 'tfidf'):
@@ -185,19 +188,46 @@ class LabellingAssistant:
         if self.vectorizer_trained and not retrain:
             return
 
-        string_data = list()
-
-        for datum in training_data:
-            category_string = ' '.join(datum.categories)
-            string_datum = f'{datum.transaction_string} {category_string}'
-            string_data.append(string_datum)
+        string_data = [ self.prepared_transaction_to_string(datum) for datum in training_data ]
 
         self.vectorizer.fit(string_data)
 
-    def featurize_prepared_transaction(self, prepared_transaction: Tuple[str, List[str], List[float], float]) -> np.array:
+        # Streaming vectorizers stay fitted so later training keeps the counts
+        # collected by update_vectorizer, retrain_models applies them
+        if hasattr(self.vectorizer, 'partial_fit'):
+            self.vectorizer_trained = True
+
+    # Only vectorizers with streaming statistics can be updated without refitting.
+    # The labeled transaction is expanded the same way as the training data so
+    # streamed counts match what fit counts.
+    def update_vectorizer(self, prepared_transaction: Tuple[str, List[str], List[float], float]) -> None:
+        if not hasattr(self.vectorizer, 'partial_fit'):
+            return
+
+        string_data = [
+            self.prepared_transaction_to_string(training_transaction)
+            for training_transaction, _, _ in self.expand_prepared_transactions_into_training_data(prepared_transaction)
+        ]
+
+        self.vectorizer.partial_fit(string_data)
 
+    # Streamed idf statistics only take effect here, together with retraining
+    # both models, so the models always see the features they were trained on.
+    def retrain_models(self, transactions: pd.DataFrame) -> None:
+        if hasattr(self.vectorizer, 'apply_partial_fit'):
+            self.vectorizer.apply_partial_fit()
+            self.vectorizer_trained = self.vectorizer.num_documents > 0
+
+        self.train_category_model(transactions, retrain=True)
+        self.train_amount_model(transactions, retrain=True)
+
+    def prepared_transaction_to_string(self, prepared_transaction: Tuple[str, List[str], List[float], float]) -> str:
         category_string = ' '.join(prepared_transaction.categories)
-        X_vector = self.vectorizer.transform([f'{prepared_transaction.transaction_string} {category_string}'])
+        return f'{prepared_transaction.transaction_string} {category_string}'
+
+    def featurize_prepared_transaction(self, prepared_transaction: Tuple[str, List[str], List[float], float]) -> np.array:
+
+        X_vector = self.vectorizer.transform([self.prepared_transaction_to_string(prepared_transaction)])
 
         # NOTE: We currently only expect there to be a maximum number of 5 categories per transaction
         amount_vector = np.zeros(5)
@@ -271,6 +301,8 @@ class LabellingAssistant:
                         assert abs(total_amount - sum(prepared_transaction.amounts)) <= eps
                         break
 
+                self.update_vectorizer(prepared_transaction)
+
                 print()
                 amount_string = ','.join([str(a) for a in prepared_transaction.amounts])
                 category_string = ','.join(prepared_transaction.categories)
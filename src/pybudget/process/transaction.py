@@ -4,7 +4,7 @@ from typing import Dict, List, Tuple, Any
 import uuid
 
 from ..parse.parse import (
-    parse_transaction
+    parse_transactions
 )
 
 
@@ -25,9 +25,9 @@ def generate_additional_transaction_data(transaction: tuple) -> namedtuple:
 
 def convert_transactions_to_usable_data(transactions: Dict[str, List[Tuple[Any]]]) -> bool:
     new_processed_transactions = [
-        parse_transaction(transaction, transaction_type)
+        transaction
         for transaction_type, raw_transaction_list in transactions.items()
-        for transaction in raw_transaction_list
+        for transaction in parse_transactions(raw_transaction_list, transaction_type)
     ]
 
     new_processed_transactions = map(generate_additional_transaction_data, new_processed_transactions)
@@ -1 +1,2 @@
-from .file import FileManager
\ No newline at end of file
+from .file import FileManager
+from .ledger import Ledger, LedgerConflictError, LedgerLockTimeout
@@ -4,13 +4,15 @@ from datetime import datetime
 import glob
 import io
 import os
-from typing import Dict
+from typing import Any, Dict
 
 import pandas as pd
 import yaml
 
+from .ledger import Ledger
 from .manager import StorageManager
 
+from ..parse import institution_parsers
 from ..process import convert_transactions_to_usable_data
 
 # TODO: Store this in a better place
@@ -29,25 +31,21 @@ class FileManager(StorageManager):
         'hash',
         'human_confirmed'
     ]
-    filetype_regexes = list([
-        'amex*',
-        'chase*',
-        'navyfed*',
-        'becu*'
-    ])
 
     def __init__(self) -> None:
         self.budget = None
         self.budget_updated = False
 
+        self.ledger = Ledger(FileManager.master_filename, FileManager.master_columns)
+        self.snapshot = None
         self.transactions = None
         self.transactions_updated = False
 
-    def update_budget(self, budget: Dict[str, int]) -> None:
+    def update_budget(self, budget: Dict[str, Any]) -> None:
         self.budget = budget
         self.budget_updated = True
 
-    def get_budget(self) -> Dict[str, int]:
+    def get_budget(self) -> Dict[str, Any]:
         if self.budget is None:
             with open(self.main_budget_filename, 'r') as f:
                 budget = yaml.safe_load(f)
@@ -58,12 +56,11 @@ class FileManager(StorageManager):
 
     # default dates can be any window that we won't need transactions outside of
     def get_transactions(self, start_date: str = '01/01/0001', end_date: str = '01/01/2100') -> pd.DataFrame:
+        # the snapshot is shared with other readers of the ledger, so it is
+        # only ever filtered here and never modified in place
         if self.transactions is None:
-            self.transactions = pd.read_csv(
-                FileManager.master_filename,
-                names=FileManager.master_columns
-            )
-            self.transactions['date'] = pd.to_datetime(self.transactions['date'])
+            self.snapshot = self.ledger.snapshot()
+            self.transactions = self.snapshot.transactions
 
         start = datetime.strptime(start_date, '%m/%d/%Y')
         end = datetime.strptime(end_date, '%m/%d/%Y')
@@ -97,14 +94,14 @@ class FileManager(StorageManager):
             self.budget_updated = False
 
         if self.transactions_updated:
-            self.transactions.to_csv(FileManager.master_filename, header=False, index=False)
+            self.snapshot = self.ledger.commit(self.snapshot, self.transactions)
+            self.transactions = self.snapshot.transactions
             self.transactions_updated = False
 
     def load_new_transactions(self) -> None:
         filetype_to_transactions = defaultdict(list)
-        for filetype_regex in FileManager.filetype_regexes:
-            for filename in glob.glob(filetype_regex):
-                filetype = FileManager._convert_filename_to_filetype(filename)
+        for filetype, parser in institution_parsers.items():
+            for filename in glob.glob(parser.filename_pattern):
                 with open(filename, 'r') as csvfile:
                     reader = csv.reader(csvfile)
                     for i, row in enumerate(reader):
@@ -140,16 +137,3 @@ class FileManager(StorageManager):
         ))
 
         self.transactions_updated = True
-
-
-    def _convert_filename_to_filetype(filename: str) -> str:
-        if 'amex' in filename:
-            return 'amex'
-        elif 'chase' in filename:
-            return 'chase'
-        elif 'navyfed' in filename:
-            return 'navyfed'
-        elif 'becu' in filename:
-            return 'becu'
-        else:
-            raise NotImplementedError(f'{filename} not implemented')
\ No newline at end of file
@@ -0,0 +1,175 @@
+from collections import namedtuple
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+
+Snapshot = namedtuple('Snapshot', 'version transactions')
+
+
+class LedgerConflictError(Exception):
+
+    def __init__(self, ids: List[str]) -> None:
+        super().__init__(f'Transactions changed by another writer: {", ".join(ids)}')
+        self.ids = ids
+
+
+class LedgerLockTimeout(TimeoutError):
+    pass
+
+
+class LedgerLock:
+
+    poll_interval = 0.05
+
+    def __init__(self, filename: str, timeout: float = 10.0) -> None:
+        self.lock_filename = f'{filename}.lock'
+        self.timeout = timeout
+
+    def __enter__(self) -> 'LedgerLock':
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            try:
+                fd = os.open(self.lock_filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if time.monotonic() >= deadline:
+                    raise LedgerLockTimeout(
+                        f'Could not lock {self.lock_filename}, remove it if no other writer is running'
+                    )
+                time.sleep(self.poll_interval)
+                continue
+
+            with os.fdopen(fd, 'w') as f:
+                f.write(str(os.getpid()))
+
+            return self
+
+    def __exit__(self, *exc) -> None:
+        os.remove(self.lock_filename)
+
+
+# Readers never take the lock. Writers replace the csv atomically so a reader
+# always parses a complete file, and parsed snapshots are shared between every
+# Ledger on the same file until its version changes.
+#
+# On Windows the csv cannot be replaced while a reader has it open, so writers
+# retry until lock_timeout and give up with the PermissionError after that.
+class Ledger:
+
+    _snapshots: Dict[str, Snapshot] = dict()
+    _snapshots_lock = threading.Lock()
+
+    def __init__(self, filename: str, columns: List[str], lock_timeout: float = 10.0) -> None:
+        self.filename = filename
+        self.columns = columns
+        self.lock_timeout = lock_timeout
+
+    # every write replaces the file, so the inode changes even when the mtime
+    # and size do not
+    def version(self) -> Tuple[int, int, int]:
+        stat = os.stat(self.filename)
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def snapshot(self) -> Snapshot:
+        key = os.path.abspath(self.filename)
+
+        while True:
+            version = self.version()
+
+            with Ledger._snapshots_lock:
+                cached = Ledger._snapshots.get(key)
+            if cached is not None and cached.version == version:
+                return cached
+
+            transactions = pd.read_csv(self.filename, names=self.columns)
+            transactions['date'] = pd.to_datetime(transactions['date'])
+
+            # the file was replaced while we were reading it
+            if self.version() != version: continue
+
+            snapshot = Snapshot(version, transactions)
+            with Ledger._snapshots_lock:
+                Ledger._snapshots[key] = snapshot
+
+            return snapshot
+
+    def commit(self, base: Snapshot, transactions: pd.DataFrame) -> Snapshot:
+        with LedgerLock(self.filename, self.lock_timeout):
+            current = self.snapshot()
+
+            if current.version != base.version:
+                transactions = self._merge(base.transactions, transactions, current.transactions)
+
+            self._write(transactions)
+
+            snapshot = Snapshot(self.version(), transactions)
+            with Ledger._snapshots_lock:
+                Ledger._snapshots[os.path.abspath(self.filename)] = snapshot
+
+        return snapshot
+
+    def _merge(self, base: pd.DataFrame, ours: pd.DataFrame, theirs: pd.DataFrame) -> pd.DataFrame:
+        base_rows = self._comparable(base)
+        our_rows = self._comparable(ours)
+        their_rows = self._comparable(theirs)
+
+        our_changes = self._changed_ids(base_rows, our_rows)
+        their_changes = self._changed_ids(base_rows, their_rows)
+
+        both_changed = our_changes.intersection(their_changes)
+        conflicts = both_changed[
+            (our_rows.loc[both_changed] != their_rows.loc[both_changed]).any(axis=1).to_numpy()
+        ]
+        if len(conflicts):
+            raise LedgerConflictError(list(conflicts))
+
+        ours = ours.set_index('id')
+        theirs = theirs.set_index('id')
+
+        added = our_changes.difference(theirs.index)
+        updated = our_changes.intersection(theirs.index)
+
+        theirs.loc[updated] = ours.loc[updated, theirs.columns]
+
+        merged = pd.concat((ours.loc[added], theirs))
+        return merged.reset_index()[self.columns]
+
+    def _comparable(self, transactions: pd.DataFrame) -> pd.DataFrame:
+        value_columns = [ c for c in self.columns if c != 'id' ]
+        return transactions.set_index('id')[value_columns].astype(str)
+
+    def _changed_ids(self, base_rows: pd.DataFrame, rows: pd.DataFrame) -> pd.Index:
+        added = rows.index.difference(base_rows.index)
+        common = rows.index.intersection(base_rows.index)
+        modified = common[(rows.loc[common] != base_rows.loc[common]).any(axis=1).to_numpy()]
+
+        return added.union(modified)
+
+    def _write(self, transactions: pd.DataFrame) -> None:
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        fd, temp_filename = tempfile.mkstemp(dir=directory, suffix='.csv')
+
+        try:
+            with os.fdopen(fd, 'w', newline='') as f:
+                transactions.to_csv(f, header=False, index=False)
+            self._replace(temp_filename)
+        except BaseException:
+            os.remove(temp_filename)
+            raise
+
+    def _replace(self, temp_filename: str) -> None:
+        deadline = time.monotonic() + self.lock_timeout
+
+        while True:
+            try:
+                os.replace(temp_filename, self.filename)
+                return
+            except PermissionError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(LedgerLock.poll_interval)
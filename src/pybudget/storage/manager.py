@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Any, Dict
 
 import pandas as pd
 
@@ -23,11 +23,11 @@ class StorageManager(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_budget(self) -> Dict[str, int]:
+    def get_budget(self) -> Dict[str, Any]:
         raise NotImplementedError
 
     @abstractmethod
-    def update_budget(self, new_budget: Dict[str, int]) -> None:
+    def update_budget(self, new_budget: Dict[str, Any]) -> None:
         raise NotImplementedError
 
     @abstractmethod
@@ -0,0 +1,90 @@
+import os
+
+import pandas as pd
+import pytest
+import yaml
+
+from pybudget.account import evaluate_budgets, get_budget_report, load_budget_allocations, set_budget
+
+
+MAIN_BUDGET = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'budgets', 'main.yaml')
+
+
+@pytest.fixture
+def transactions():
+    return pd.DataFrame({
+        'date': pd.to_datetime(['2024-04-02', '2024-05-03', '2024-05-04']),
+        'amount': ['20.0', '10.0,5.0', '7.0'],
+        'category': ['food', 'food,rent', 'TO_LABEL']
+    })
+
+
+def evaluation_row(evaluation: pd.DataFrame, budget: str, month: str, category: str) -> pd.Series:
+    return evaluation.loc[
+        (evaluation['budget'] == budget) &
+        (evaluation['month'] == pd.Period(month, freq='M')) &
+        (evaluation['category'] == category)
+    ].iloc[0]
+
+
+def test_evaluate_flat_main_budget(transactions):
+    with open(MAIN_BUDGET, 'r') as f:
+        budget = yaml.safe_load(f)
+
+    evaluation = evaluate_budgets(budget, transactions)
+
+    assert len(evaluation) == 2 * len(budget)
+    assert set(evaluation['budget']) == { 'main' }
+
+    food = evaluation_row(evaluation, 'main', '2024-04', 'food')
+    assert food['spent'] == 20.0
+    assert food['percent_used'] == 20.0
+    assert food['monthly_average'] == 15.0
+    assert food['difference_from_average'] == 5.0
+
+    rent = evaluation_row(evaluation, 'main', '2024-04', 'rent')
+    assert rent['spent'] == 0.0
+    assert rent['difference_from_average'] == -2.5
+
+
+def test_evaluate_period_overrides(transactions):
+    budget = {
+        'main': { 'default': { 'food': 100 }, '2024-05': { 'food': 50 } },
+        'housing': { 'rent': 10 }
+    }
+
+    evaluation = evaluate_budgets(budget, transactions)
+
+    assert evaluation_row(evaluation, 'main', '2024-04', 'food')['allocated'] == 100.0
+    assert evaluation_row(evaluation, 'main', '2024-05', 'food')['percent_used'] == 20.0
+    assert evaluation_row(evaluation, 'housing', '2024-05', 'rent')['percent_used'] == 50.0
+
+
+@pytest.mark.parametrize('budget', [
+    { 'food': None },
+    { 'food': 'lots' },
+    { 'main': { '2024-13': { 'food': 100 } } },
+    { 'main': 100, 'other': { 'food': 100 } }
+])
+def test_load_budget_allocations_rejects_malformed_budget(budget):
+    with pytest.raises(ValueError):
+        load_budget_allocations(budget)
+
+
+def test_budget_report_zero_allocation_and_average(transactions, capsys):
+    get_budget_report({ 'food': 100, 'rent': 0, 'pets': 10 }, transactions)
+
+    output = capsys.readouterr().out
+
+    assert 'nan' not in output
+    assert '\trent: $0.00 of $0.00 used (nothing allocated) ==> $2.50 (100%) below Monthly Average' in output
+    assert '\tpets: $0.00 of $10.00 used (0%) ==> at Monthly Average' in output
+    assert '\tfood: $20.00 of $100.00 used (20%) ==> $5.00 (33%) above Monthly Average' in output
+
+
+def test_set_budget_walks_nested_budgets(monkeypatch):
+    budget = { 'main': { 'default': { 'food': 100 }, '2024-05': { 'food': 50 } }, 'housing': { 'rent': 10 } }
+    answers = iter(['120', '', '', '', '15', ''])
+    monkeypatch.setattr('builtins.input', lambda prompt: next(answers))
+
+    assert set_budget(budget) == { 'main': { 'default': { 'food': 120 }, '2024-05': { 'food': 50 } }, 'housing': { 'rent': 15 } }
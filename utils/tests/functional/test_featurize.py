@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from pybudget.process import HashedTfidfVectorizer
+
+
+DOCUMENTS = ['LOWES #0000 chase home', 'SAFEWAY #0000 navyfed food', 'COSTCO WHSE becu food']
+
+
+def test_fit_matches_tfidf_without_collisions():
+    hashed = HashedTfidfVectorizer(n_features=2 ** 20).fit_transform(DOCUMENTS).toarray()
+    tfidf = TfidfVectorizer(analyzer='char', ngram_range=(1, 2)).fit_transform(DOCUMENTS).toarray()
+
+    for hashed_row, tfidf_row in zip(hashed, tfidf):
+        assert np.allclose(np.sort(hashed_row[hashed_row > 0]), np.sort(tfidf_row[tfidf_row > 0]))
+
+
+def test_partial_fit_is_frozen_until_applied():
+    vectorizer = HashedTfidfVectorizer().fit(DOCUMENTS)
+    before = vectorizer.transform(DOCUMENTS[:1]).toarray()
+
+    vectorizer.partial_fit(['TARGET chase food'])
+    assert np.array_equal(vectorizer.transform(DOCUMENTS[:1]).toarray(), before)
+
+    vectorizer.apply_partial_fit()
+    assert vectorizer.num_documents == 4
+    assert vectorizer.pending_num_documents == 0
+    assert not np.array_equal(vectorizer.transform(DOCUMENTS[:1]).toarray(), before)
+
+
+def test_merge_matches_single_fit():
+    merged = HashedTfidfVectorizer().fit(DOCUMENTS[:1])
+    merged.merge(HashedTfidfVectorizer().fit(DOCUMENTS[1:]))
+
+    single = HashedTfidfVectorizer().fit(DOCUMENTS)
+
+    assert merged.num_documents == single.num_documents
+    assert np.array_equal(merged.document_frequencies, single.document_frequencies)
+
+
+def test_merge_rejects_different_feature_counts():
+    with pytest.raises(ValueError):
+        HashedTfidfVectorizer().merge(HashedTfidfVectorizer(n_features=2 ** 10))
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pybudget import LabellingAssistant
+
+
+pytestmark = pytest.mark.filterwarnings('ignore::sklearn.exceptions.ConvergenceWarning')
+
+CATEGORIES = ['food', 'rent', 'pets', 'hobbies']
+
+
+@pytest.fixture
+def transactions():
+    return pd.DataFrame([
+        {
+            'date': f'2024-04-{i % 28 + 1:02d}',
+            'description': f'STORE {CATEGORIES[i % 4].upper()} #{i}',
+            'amount': str(float(10 + i)),
+            'institution': 'chase',
+            'category': CATEGORIES[i % 4],
+            'hash': str(i)
+        }
+        for i in range(40)
+    ])
+
+
+def test_hashed_vectorizer_streams_counts_until_retrain(transactions):
+    la = LabellingAssistant(vectorizer='hashed')
+    la.train_category_model(transactions)
+    la.train_amount_model(transactions)
+
+    assert la.vectorizer_trained
+
+    num_documents = la.vectorizer.num_documents
+    document_frequencies = la.vectorizer.document_frequencies.copy()
+
+    prepared_transaction = la.prepare_transaction_for_featurization(next(transactions.itertuples()))
+    num_streamed = len(list(la.expand_prepared_transactions_into_training_data(prepared_transaction)))
+    la.update_vectorizer(prepared_transaction)
+
+    assert la.vectorizer.pending_num_documents == num_streamed
+    pending_document_frequencies = la.vectorizer.pending_document_frequencies.copy()
+
+    # retraining through the usual entry point must not refit and drop the streamed counts
+    la.train_category_model(transactions, retrain=True)
+    assert la.vectorizer.num_documents == num_documents
+    assert la.vectorizer.pending_num_documents == num_streamed
+
+    la.retrain_models(transactions)
+
+    assert la.vectorizer.num_documents == num_documents + num_streamed
+    assert la.vectorizer.pending_num_documents == 0
+    assert np.array_equal(la.vectorizer.document_frequencies, document_frequencies + pending_document_frequencies)
@@ -0,0 +1,101 @@
+import os
+
+import pandas as pd
+import pytest
+
+from pybudget.storage import FileManager, Ledger, LedgerConflictError
+
+
+LEDGER_ROWS = [
+    ['2022-08-02', 'LOWES #0000*', 17.14, 'chase', 'TO_LABEL', 'id-0', 'hash-0', 0],
+    ['2022-08-03', 'SAFEWAY #0000', 45.2, 'navyfed', 'food', 'id-1', 'hash-1', 1],
+    ['2022-08-04', 'COSTCO WHSE #0000', 88.45, 'becu', 'TO_LABEL', 'id-2', 'hash-2', 0]
+]
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    filename = os.path.join(tmp_path, 'all_transactions.csv')
+    pd.DataFrame(LEDGER_ROWS).to_csv(filename, header=False, index=False)
+
+    return Ledger(filename, FileManager.master_columns, lock_timeout=1.0)
+
+
+def relabel(transactions: pd.DataFrame, id: str, category: str) -> pd.DataFrame:
+    transactions = transactions.copy()
+    transactions.loc[transactions['id'] == id, 'category'] = category
+    return transactions
+
+
+def read_categories(ledger: Ledger) -> dict:
+    transactions = Ledger(ledger.filename, ledger.columns).snapshot().transactions
+    return dict(zip(transactions['id'], transactions['category']))
+
+
+def test_snapshot_is_shared_between_readers(ledger):
+    first = ledger.snapshot()
+    second = Ledger(ledger.filename, ledger.columns).snapshot()
+
+    assert first.transactions is second.transactions
+
+
+def test_commit_changes_version(ledger):
+    base = ledger.snapshot()
+    committed = ledger.commit(base, base.transactions)
+
+    assert committed.version != base.version
+    assert ledger.snapshot() is committed
+    assert not os.path.exists(f'{ledger.filename}.lock')
+
+
+def test_commit_merges_writers_changing_different_ids(ledger):
+    first_base = ledger.snapshot()
+    second_base = ledger.snapshot()
+
+    ledger.commit(first_base, relabel(first_base.transactions, 'id-0', 'rent'))
+    ledger.commit(second_base, relabel(second_base.transactions, 'id-2', 'food'))
+
+    assert read_categories(ledger) == { 'id-0': 'rent', 'id-1': 'food', 'id-2': 'food' }
+
+
+def test_commit_merges_new_transactions_with_relabel(ledger):
+    import_base = ledger.snapshot()
+    label_base = ledger.snapshot()
+
+    new_transaction = pd.DataFrame(
+        [[pd.Timestamp('2022-08-05'), 'TARGET 00000000', 10.94, 'chase', 'TO_LABEL', 'id-3', 'hash-3', 0]],
+        columns=FileManager.master_columns
+    )
+    ledger.commit(import_base, pd.concat((new_transaction, import_base.transactions)))
+    ledger.commit(label_base, relabel(label_base.transactions, 'id-0', 'hobbies'))
+
+    assert read_categories(ledger) == {
+        'id-0': 'hobbies',
+        'id-1': 'food',
+        'id-2': 'TO_LABEL',
+        'id-3': 'TO_LABEL'
+    }
+
+
+def test_commit_raises_on_conflicting_changes(ledger):
+    first_base = ledger.snapshot()
+    second_base = ledger.snapshot()
+
+    ledger.commit(first_base, relabel(first_base.transactions, 'id-0', 'rent'))
+
+    with pytest.raises(LedgerConflictError) as error:
+        ledger.commit(second_base, relabel(second_base.transactions, 'id-0', 'food'))
+
+    assert error.value.ids == ['id-0']
+    assert read_categories(ledger)['id-0'] == 'rent'
+    assert not os.path.exists(f'{ledger.filename}.lock')
+
+
+def test_commit_allows_identical_changes(ledger):
+    first_base = ledger.snapshot()
+    second_base = ledger.snapshot()
+
+    ledger.commit(first_base, relabel(first_base.transactions, 'id-0', 'rent'))
+    ledger.commit(second_base, relabel(second_base.transactions, 'id-0', 'rent'))
+
+    assert read_categories(ledger)['id-0'] == 'rent'
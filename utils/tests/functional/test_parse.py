@@ -0,0 +1,116 @@
+import csv
+from datetime import datetime
+import os
+
+import pytest
+
+from pybudget.parse import parse_transaction, parse_transactions
+from pybudget.parse.parse import Transaction
+
+
+CHASE_TEST_DATA = os.path.join(os.path.dirname(__file__), 'chase_test_data.csv')
+
+AMEX_ROWS = [
+    ['08/02/2022', 'DELTA AIR LINES', '250.10'],
+    ['08/05/2022', 'ONLINE PAYMENT - THANK YOU', '-300.00']
+]
+
+NAVYFED_ROWS = [
+    ['08/02/2022', '45.20', 'Debit', '', '', '', '', '', '', 'SAFEWAY #0000', '', '', ''],
+    ['08/03/2022', '1200.00', 'Credit', '', '', '', '', '', '', 'PAYROLL DEPOSIT', '', '', '']
+]
+
+BECU_ROWS = [
+    ['08/02/2022', '0000', 'COSTCO WHSE #0000', '-88.45', ''],
+    ['08/04/2022', '0001', 'DIRECT DEPOSIT', '', '1500.00']
+]
+
+BECU_CREDIT_ROWS = [
+    ['08/04/2022', '0001', 'DIRECT DEPOSIT', '', '1500.00'],
+    ['08/18/2022', '0002', 'INTEREST EARNED', '', '0.12']
+]
+
+
+def read_chase_rows():
+    with open(CHASE_TEST_DATA, 'r') as csvfile:
+        return list(csv.reader(csvfile))[1:]
+
+
+def test_parse_chase_negates_amounts():
+    rows = read_chase_rows()
+
+    assert parse_transaction(rows[0], 'chase') == Transaction(datetime(2022, 8, 2), 'LOWES #0000*', 17.14, 'chase')
+    assert parse_transaction(rows[5], 'chase').amount == -273.25
+
+
+def test_parse_amex_keeps_amounts():
+    assert parse_transaction(AMEX_ROWS[0], 'amex') == Transaction(datetime(2022, 8, 2), 'DELTA AIR LINES', 250.10, 'amex')
+    assert parse_transaction(AMEX_ROWS[1], 'amex').amount == -300.0
+
+
+def test_parse_navyfed_negates_credits():
+    assert parse_transaction(NAVYFED_ROWS[0], 'navyfed') == Transaction(datetime(2022, 8, 2), 'SAFEWAY #0000', 45.20, 'navyfed')
+    assert parse_transaction(NAVYFED_ROWS[1], 'navyfed').amount == -1200.0
+
+
+def test_parse_becu_debit_and_credit_columns():
+    assert parse_transaction(BECU_ROWS[0], 'becu') == Transaction(datetime(2022, 8, 2), 'COSTCO WHSE #0000', 88.45, 'becu')
+    assert parse_transaction(BECU_ROWS[1], 'becu').amount == -1500.0
+
+
+MALFORMED_ROWS = [
+    (['08/02/2022', 'DELTA AIR LINES', ''], 'amex'),
+    (['', 'DELTA AIR LINES', '250.10'], 'amex'),
+    (['08/02/2022', 'DELTA AIR LINES'], 'amex'),
+    (['08/02/2022', '08/04/2022', 'LOWES #0000*', 'Home', 'Sale', '', ''], 'chase'),
+    (['08/02/2022', '', 'Debit', '', '', '', '', '', '', 'SAFEWAY #0000', '', '', ''], 'navyfed'),
+    (['08/02/2022', '0000', 'COSTCO WHSE #0000', '', ''], 'becu'),
+    (['08/02/2022', '0000', 'COSTCO WHSE #0000', '-88.45'], 'becu')
+]
+
+
+@pytest.mark.parametrize('row, transaction_type', MALFORMED_ROWS)
+def test_parse_transaction_rejects_malformed_rows(row, transaction_type):
+    with pytest.raises(ValueError):
+        parse_transaction(row, transaction_type)
+
+
+@pytest.mark.parametrize('rows, transaction_type', [
+    (read_chase_rows(), 'chase'),
+    (AMEX_ROWS, 'amex'),
+    (NAVYFED_ROWS, 'navyfed'),
+    (BECU_ROWS, 'becu'),
+    (BECU_CREDIT_ROWS, 'becu')
+] + [
+    # a malformed row must fail the whole batch, even after well-formed rows
+    (rows + [row], transaction_type)
+    for rows, transaction_type in [
+        (AMEX_ROWS, 'amex'),
+        (read_chase_rows(), 'chase'),
+        (NAVYFED_ROWS, 'navyfed'),
+        (BECU_ROWS, 'becu')
+    ]
+    for row, malformed_type in MALFORMED_ROWS
+    if malformed_type == transaction_type
+])
+def test_parse_transactions_matches_parse_transaction(rows, transaction_type):
+    try:
+        expected = [ parse_transaction(row, transaction_type) for row in rows ]
+    except ValueError:
+        with pytest.raises(ValueError):
+            parse_transactions(rows, transaction_type)
+        return
+
+    batch = parse_transactions(rows, transaction_type)
+
+    assert batch == expected
+    assert all(type(t.date) is datetime and type(t.amount) is float for t in batch)
+
+
+def test_parse_transactions_empty():
+    assert parse_transactions(list(), 'chase') == list()
+
+
+def test_parse_unknown_institution():
+    with pytest.raises(NotImplementedError):
+        parse_transaction(AMEX_ROWS[0], 'unknown')